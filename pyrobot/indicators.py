@@ -1,11 +1,311 @@
+import functools
 import numpy as np
 import pandas as pd
 
+from dataclasses import dataclass
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import List
+from typing import Tuple
 from typing import Union
 
 from pyrobot.stock_frame import StockFrame
+from pyrobot.stock_frame import _SIGNAL_DTYPE
+from pyrobot.stock_frame import _signal_row
+from pyrobot.jit import NUMBA_AVAILABLE as _NUMBA_AVAILABLE
+from pyrobot.jit import njit
+from pyrobot.jit import prange
+
+# Every fast-math flag except `nnan` and `ninf`, the kernels have to check for missing values.
+_FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+# How often the online kernels recompute their running sums from the window itself.
+_RESYNC_STEPS = 1024
+
+try:
+    from pyrobot.indicators_c import lr_proj_c
+    _CYTHON_AVAILABLE = True
+except ImportError:
+    _CYTHON_AVAILABLE = False
+
+
+@njit(cache=True, fastmath=_FASTMATH, boundscheck=False)
+def _lr_proj_online(y: np.ndarray, periods: np.ndarray, out: np.ndarray) -> None:
+    """Calculates rolling linear regression projections in a single pass.
+
+    Overview:
+    ----
+    Fits a least-squares line over each window of `n` values, using `x = 0..n-1`,
+    and returns the value of that line at the last point of the window. Since `x`
+    is the same for every window, `sum(x)` and `sum(x^2)` are constants and only
+    `sum(y)` and `sum(x*y)` have to be updated as the window slides, which makes
+    each step O(1) instead of O(n).
+
+    Every window size in `periods` is updated from the same read of `y`, so
+    several projections cost a single pass over the data.
+
+    Missing values are added to the sums as `0` and counted, so any window that
+    holds one is `NaN` and the windows after it are unaffected.
+
+    Sliding the sums adds a little rounding error at every step, so every 1024
+    steps they are recomputed from the window, at most once every `n` steps.
+    That keeps long series accurate and each step still costs O(1) on average.
+
+    Arguments:
+    ----
+    y {np.ndarray} -- The `float32` or `float64` values to regress, normally the
+        closing prices of one symbol. The sums are always kept in `float64`.
+
+    periods {np.ndarray} -- The sizes of the regression windows.
+
+    out {np.ndarray} -- A `(T, K)` matrix the projections are written to, with one
+        column per window size. The first `n - 1` values of each column are `NaN`.
+    """
+
+    size = y.shape[0]
+
+    # The running sums and the number of missing values for each window size.
+    sum_y = np.zeros(periods.shape[0])
+    sum_xy = np.zeros(periods.shape[0])
+    missing = np.zeros(periods.shape[0], dtype=np.int64)
+
+    # When the sums were last recomputed from the window.
+    resynced = np.zeros(periods.shape[0], dtype=np.int64)
+
+    for t in range(size):
+
+        # Start over from the window ending at the previous value, before the rounding errors build up.
+        if t > 0 and t % _RESYNC_STEPS == 0:
+
+            for k in range(periods.shape[0]):
+
+                n = periods[k]
+                if n < 2 or t < n or t - resynced[k] < n:
+                    continue
+
+                resynced[k] = t
+                sum_y[k] = 0.0
+                sum_xy[k] = 0.0
+
+                for j in range(n):
+                    window_value = y[t - n + j]
+                    if not np.isnan(window_value):
+                        sum_y[k] += window_value
+                        sum_xy[k] += j * window_value
+
+        value = y[t]
+        value_missing = np.isnan(value)
+        if value_missing:
+            value = 0.0
+
+        for k in range(periods.shape[0]):
+
+            n = periods[k]
+            if n < 2:
+                out[t, k] = np.nan
+                continue
+
+            # Slide the window, every value shifts one step to the left.
+            if t >= n:
+
+                leaving = y[t - n]
+                if np.isnan(leaving):
+                    leaving = 0.0
+                    missing[k] -= 1
+
+                sum_xy[k] += (n - 1) * value - (sum_y[k] - leaving)
+                sum_y[k] += value - leaving
+
+            else:
+                sum_xy[k] += t * value
+                sum_y[k] += value
+
+            if value_missing:
+                missing[k] += 1
+
+            if t < n - 1 or missing[k] > 0:
+                out[t, k] = np.nan
+                continue
+
+            # These only depend on the window size.
+            sum_x = n * (n - 1) / 2.0
+            sum_xx = (n - 1) * n * (2 * n - 1) / 6.0
+
+            slope = (n * sum_xy[k] - sum_x * sum_y[k]) / (n * sum_xx - sum_x * sum_x)
+            intercept = (sum_y[k] - slope * sum_x) / n
+            out[t, k] = intercept + slope * (n - 1)
+
+
+@njit(cache=True, fastmath=_FASTMATH, boundscheck=False, parallel=True)
+def _lr_proj_grouped(y: np.ndarray, starts: np.ndarray, periods: np.ndarray, out: np.ndarray) -> None:
+    """Calculates the rolling linear regression projections for each symbol in parallel.
+
+    Overview:
+    ----
+    Symbols don't depend on each other, so each one is handed to its own thread
+    and writes straight into its own rows of `out`.
+
+    Arguments:
+    ----
+    y {np.ndarray} -- The `float32` or `float64` values to regress, with each
+        symbol's rows stored next to each other.
+
+    starts {np.ndarray} -- The offset where each symbol begins, followed by the
+        length of `y`.
+
+    periods {np.ndarray} -- The sizes of the regression windows.
+
+    out {np.ndarray} -- A `(T, K)` matrix the projections are written to, in the
+        same order as `y`.
+    """
+
+    for i in prange(starts.shape[0] - 1):
+        start = starts[i]
+        end = starts[i + 1]
+        _lr_proj_online(y[start:end], periods, out[start:end])
+
+
+def _column_values(column: pd.Series) -> np.ndarray:
+    """Returns a column as a contiguous array, without copying it when possible.
+
+    Overview:
+    ----
+    Columns stored as `float32` are read as they are, the kernels keep their sums
+    in `float64` either way, so converting them first would only add a copy.
+    Everything else is read as `float64`. Columns backed by PyArrow keep their
+    values in a single buffer, which can be handed to the kernels directly as
+    long as there's one chunk and no missing values.
+
+    Arguments:
+    ----
+    column {pd.Series} -- The column to read.
+
+    Returns:
+    ----
+    {np.ndarray} -- A C-contiguous `float32` or `float64` array of the column's values.
+    """
+
+    # Older versions of pandas don't have PyArrow backed columns.
+    arrow_dtype = getattr(pd, 'ArrowDtype', None)
+
+    if arrow_dtype is not None and isinstance(column.dtype, arrow_dtype):
+
+        arrow_array = column.array.__arrow_array__()
+
+        if arrow_array.num_chunks == 1:
+
+            chunk = arrow_array.chunk(0)
+
+            if chunk.null_count == 0 and chunk.type.to_pandas_dtype() in (np.float32, np.float64):
+                return chunk.to_numpy(zero_copy_only=True)
+
+    dtype = np.float32 if column.dtype == np.float32 else np.float64
+
+    return np.ascontiguousarray(column.to_numpy(), dtype=dtype)
+
+
+@functools.lru_cache(maxsize=32)
+def _basis(n: int) -> Tuple[np.ndarray, float]:
+    """Returns the centered `x` values of a regression window and their sum of squares.
+
+    Arguments:
+    ----
+    n {int} -- The size of the regression window.
+
+    Returns:
+    ----
+    {Tuple[np.ndarray, float]} -- The read-only centered `x` values and the sum
+        of their squares.
+    """
+
+    x = np.arange(n, dtype=np.float64)
+    x_centered = x - x.mean()
+    x_centered.setflags(write=False)
+
+    return x_centered, (x_centered * x_centered).sum()
+
+
+def _sliding_windows(y: np.ndarray, n: int) -> np.ndarray:
+    """Returns a read-only view of every window of `n` rows, without copying the data.
+
+    Arguments:
+    ----
+    y {np.ndarray} -- A `(T, S)` matrix.
+
+    n {int} -- The size of the window.
+
+    Returns:
+    ----
+    {np.ndarray} -- A `(T - n + 1, S, n)` view of `y`.
+    """
+
+    if hasattr(np.lib.stride_tricks, 'sliding_window_view'):
+        return np.lib.stride_tricks.sliding_window_view(y, n, axis=0)
+
+    # Older versions of NumPy don't have `sliding_window_view`.
+    return np.lib.stride_tricks.as_strided(
+        y,
+        shape=(y.shape[0] - n + 1, y.shape[1], n),
+        strides=(y.strides[0], y.strides[1], y.strides[0]),
+        writeable=False
+    )
+
+
+def _lr_proj_wide(y: np.ndarray, n: int) -> np.ndarray:
+    """Calculates the rolling linear regression projection for every column at once.
+
+    Overview:
+    ----
+    The vectorized version of `_lr_proj_online`, used when neither Numba nor the
+    Cython extension are installed. Each column holds one symbol, and every
+    window is a strided view of it, so the slopes of all the windows are a single
+    BLAS matrix-vector product against the centered `x` values.
+
+    Arguments:
+    ----
+    y {np.ndarray} -- A `(T, S)` matrix of `float32` or `float64` values, with one
+        column per symbol.
+
+    n {int} -- The size of the regression window.
+
+    Returns:
+    ----
+    {np.ndarray} -- A `(T, S)` matrix of projections, the first `n - 1` rows are `NaN`.
+    """
+
+    out = np.full(y.shape, np.nan)
+
+    if n < 2 or y.shape[0] < n:
+        return out
+
+    x_centered, denominator = _basis(n)
+
+    # Mixing types would make NumPy cast every window into a new `(T, S, n)` array,
+    # so cast the values once instead and keep the windows a view.
+    windows = _sliding_windows(np.ascontiguousarray(y, dtype=np.float64), n)
+
+    # The mean of the window is the value of the line at the middle `x`.
+    slope = np.einsum('tsk,k->ts', windows, x_centered, optimize=True) / denominator
+    mean = windows.mean(axis=-1)
+    out[n - 1:] = mean + slope * (n - 1) / 2.0
+
+    return out
+
+
+@dataclass
+class IndicatorSpec():
+
+    """
+    Represents an indicator that has been added to a StockFrame, so
+    it can be calculated again when new rows are added.
+    """
+
+    __slots__ = ('func', 'args')
+
+    func: Callable
+    args: dict
+
 
 class Indicators():
 
@@ -40,12 +340,13 @@ class Indicators():
         self._current_indicators = {}
         self._indicator_signals = {}
         self._frame = self._stock_frame.frame
+        self._is_multi_index = isinstance(self._frame.index, pd.MultiIndex)
 
         self._indicators_comp_key = []
         self._indicators_key = []
-        
-        if self.is_multi_index:
-            True
+
+        # The thresholds and operator codes of each signal in `_indicators_key`, as a `_SIGNAL_DTYPE` row.
+        self._sig_rows = {}
 
     def get_indicator_signal(self, indicator: str= None) -> Dict:
         """Return the raw Pandas Dataframe Object.
@@ -93,8 +394,19 @@ class Indicators():
         
         condition_sell_max {str} -- The operator which is used to evaluate the `sell_max` condition. For example, `">"` would
             represent greater than or from the `operator` module it would represent `operator.gt`. (defaults to None).
+
+        Raises:
+        ----
+        ValueError: If a max operator is passed without its max threshold.
         """
 
+        # A max operator needs a max threshold to compare against.
+        if condition_buy_max is not None and buy_max is None:
+            raise ValueError("The `condition_buy_max` operator was passed without a `buy_max` threshold.")
+
+        if condition_sell_max is not None and sell_max is None:
+            raise ValueError("The `condition_sell_max` operator was passed without a `sell_max` threshold.")
+
         # Add the key if it doesn't exist.
         if indicator not in self._indicator_signals:
             self._indicator_signals[indicator] = {}
@@ -112,6 +424,9 @@ class Indicators():
         self._indicator_signals[indicator]['buy_operator_max'] = condition_buy_max
         self._indicator_signals[indicator]['sell_operator_max'] = condition_sell_max
 
+        # Store the thresholds and operator codes used to evaluate the signals.
+        self._sig_rows[indicator] = np.array([_signal_row(self._indicator_signals[indicator])], dtype=_SIGNAL_DTYPE)
+
     def set_indicator_signal_compare(self, indicator_1: str, indicator_2: str, condition_buy: Any, condition_sell: Any) -> None:
         """Used to set an indicator where one indicator is compared to another indicator.
 
@@ -178,6 +493,7 @@ class Indicators():
         """
 
         self._frame = price_data_frame
+        self._is_multi_index = isinstance(price_data_frame.index, pd.MultiIndex)
 
     @property
     def is_multi_index(self) -> bool:
@@ -188,10 +504,7 @@ class Indicators():
         {bool} -- `True` if the data frame is a `pd.MultiIndex` object. `False` otherwise.
         """
 
-        if isinstance(self._frame.index, pd.MultiIndex):
-            return True
-        else:
-            return False
+        return self._is_multi_index
 
     def change_in_price(self, column_name: str = 'change_in_price') -> pd.DataFrame:
         """Calculates the Change in Price.
@@ -201,12 +514,12 @@ class Indicators():
         {pd.DataFrame} -- A data frame with the Change in Price included.
         """
 
-        locals_data = locals()
-        del locals_data['self']
-        
-        self._current_indicators[column_name] = {}
-        self._current_indicators[column_name]['args'] = locals_data
-        self._current_indicators[column_name]['func'] = self.change_in_price
+        self._current_indicators[column_name] = IndicatorSpec(
+            func=self.change_in_price,
+            args={
+                'column_name': column_name
+            }
+        )
 
         self._frame[column_name] = self._price_groups['close'].transform(
             lambda x: x.diff()
@@ -243,12 +556,14 @@ class Indicators():
             >>> price_data_frame = inidcator_client.price_data_frame
         """
 
-        locals_data = locals()
-        del locals_data['self']
-
-        self._current_indicators[column_name] = {}
-        self._current_indicators[column_name]['args'] = locals_data
-        self._current_indicators[column_name]['func'] = self.rsi
+        self._current_indicators[column_name] = IndicatorSpec(
+            func=self.rsi,
+            args={
+                'period': period,
+                'method': method,
+                'column_name': column_name
+            }
+        )
 
         # First calculate the Change in Price.
         if 'change_in_price' not in self._frame.columns:
@@ -316,12 +631,13 @@ class Indicators():
             >>> indicator_client.sma(period=100)
         """
 
-        locals_data = locals()
-        del locals_data['self']
-
-        self._current_indicators[column_name] = {}
-        self._current_indicators[column_name]['args'] = locals_data
-        self._current_indicators[column_name]['func'] = self.sma
+        self._current_indicators[column_name] = IndicatorSpec(
+            func=self.sma,
+            args={
+                'period': period,
+                'column_name': column_name
+            }
+        )
 
         # Add the SMA
         self._frame[column_name] = self._price_groups['close'].transform(
@@ -356,12 +672,14 @@ class Indicators():
             >>> indicator_client.ema(period=50, alpha=1/50)
         """
 
-        locals_data = locals()
-        del locals_data['self']
-
-        self._current_indicators[column_name] = {}
-        self._current_indicators[column_name]['args'] = locals_data
-        self._current_indicators[column_name]['func'] = self.ema
+        self._current_indicators[column_name] = IndicatorSpec(
+            func=self.ema,
+            args={
+                'period': period,
+                'alpha': alpha,
+                'column_name': column_name
+            }
+        )
 
         # Add the EMA
         self._frame[column_name] = self._price_groups['close'].transform(
@@ -394,12 +712,13 @@ class Indicators():
             >>> indicator_client = Indicators(price_data_frame=price_data_frame)
             >>> indicator_client.rate_of_change()
         """
-        locals_data = locals()
-        del locals_data['self']
-
-        self._current_indicators[column_name] = {}
-        self._current_indicators[column_name]['args'] = locals_data
-        self._current_indicators[column_name]['func'] = self.rate_of_change
+        self._current_indicators[column_name] = IndicatorSpec(
+            func=self.rate_of_change,
+            args={
+                'period': period,
+                'column_name': column_name
+            }
+        )
 
         # Add the Momentum indicator.
         self._frame[column_name] = self._price_groups['close'].transform(
@@ -433,12 +752,13 @@ class Indicators():
             >>> indicator_client = Indicators(price_data_frame=price_data_frame)
             >>> indicator_client.bollinger_bands()
         """
-        locals_data = locals()
-        del locals_data['self']
-
-        self._current_indicators[column_name] = {}
-        self._current_indicators[column_name]['args'] = locals_data
-        self._current_indicators[column_name]['func'] = self.bollinger_bands
+        self._current_indicators[column_name] = IndicatorSpec(
+            func=self.bollinger_bands,
+            args={
+                'period': period,
+                'column_name': column_name
+            }
+        )
 
         # Define the Moving Avg.
         self._frame['moving_avg'] = self._price_groups['close'].transform(
@@ -494,12 +814,13 @@ class Indicators():
             >>> indicator_client.average_true_range()
         """
 
-        locals_data = locals()
-        del locals_data['self']
-
-        self._current_indicators[column_name] = {}
-        self._current_indicators[column_name]['args'] = locals_data
-        self._current_indicators[column_name]['func'] = self.average_true_range
+        self._current_indicators[column_name] = IndicatorSpec(
+            func=self.average_true_range,
+            args={
+                'period': period,
+                'column_name': column_name
+            }
+        )
 
 
         # Calculate the different parts of True Range.
@@ -544,12 +865,12 @@ class Indicators():
             >>> indicator_client.stochastic_oscillator()
         """
 
-        locals_data = locals()
-        del locals_data['self']
-
-        self._current_indicators[column_name] = {}
-        self._current_indicators[column_name]['args'] = locals_data
-        self._current_indicators[column_name]['func'] = self.stochastic_oscillator
+        self._current_indicators[column_name] = IndicatorSpec(
+            func=self.stochastic_oscillator,
+            args={
+                'column_name': column_name
+            }
+        )
 
         # Calculate the stochastic_oscillator.
         self._frame['stochastic_oscillator'] = (
@@ -587,12 +908,14 @@ class Indicators():
             >>> indicator_client.macd(fast_period=12, slow_period=26)
         """
 
-        locals_data = locals()
-        del locals_data['self']
-
-        self._current_indicators[column_name] = {}
-        self._current_indicators[column_name]['args'] = locals_data
-        self._current_indicators[column_name]['func'] = self.macd
+        self._current_indicators[column_name] = IndicatorSpec(
+            func=self.macd,
+            args={
+                'fast_period': fast_period,
+                'slow_period': slow_period,
+                'column_name': column_name
+            }
+        )
 
         # Calculate the Fast Moving MACD.
         self._frame['macd_fast'] = self._frame['close'].transform(
@@ -639,12 +962,13 @@ class Indicators():
             >>> indicator_client.mass_index(period=9)
         """
 
-        locals_data = locals()
-        del locals_data['self']
-
-        self._current_indicators[column_name] = {}
-        self._current_indicators[column_name]['args'] = locals_data
-        self._current_indicators[column_name]['func'] = self.mass_index
+        self._current_indicators[column_name] = IndicatorSpec(
+            func=self.mass_index,
+            args={
+                'period': period,
+                'column_name': column_name
+            }
+        )
 
         # Calculate the Diff.
         self._frame['diff'] = self._frame['high'] - self._frame['low']
@@ -701,12 +1025,13 @@ class Indicators():
             >>> indicator_client.force_index(period=9)
         """
 
-        locals_data = locals()
-        del locals_data['self']
-
-        self._current_indicators[column_name] = {}
-        self._current_indicators[column_name]['args'] = locals_data
-        self._current_indicators[column_name]['func'] = self.force_index
+        self._current_indicators[column_name] = IndicatorSpec(
+            func=self.force_index,
+            args={
+                'period': period,
+                'column_name': column_name
+            }
+        )
 
         # Calculate the Force Index.
         self._frame[column_name] = self._frame['close'].diff(period)  * self._frame['volume'].diff(period)
@@ -738,12 +1063,13 @@ class Indicators():
             >>> indicator_client.ease_of_movement(period=9)
         """
 
-        locals_data = locals()
-        del locals_data['self']
-
-        self._current_indicators[column_name] = {}
-        self._current_indicators[column_name]['args'] = locals_data
-        self._current_indicators[column_name]['func'] = self.ease_of_movement
+        self._current_indicators[column_name] = IndicatorSpec(
+            func=self.ease_of_movement,
+            args={
+                'period': period,
+                'column_name': column_name
+            }
+        )
         
         # Calculate the ease of movement.
         high_plus_low = (self._frame['high'].diff(1) + self._frame['low'].diff(1))
@@ -789,12 +1115,13 @@ class Indicators():
             >>> indicator_client.commodity_channel_index(period=9)
         """
 
-        locals_data = locals()
-        del locals_data['self']
-
-        self._current_indicators[column_name] = {}
-        self._current_indicators[column_name]['args'] = locals_data
-        self._current_indicators[column_name]['func'] = self.commodity_channel_index
+        self._current_indicators[column_name] = IndicatorSpec(
+            func=self.commodity_channel_index,
+            args={
+                'period': period,
+                'column_name': column_name
+            }
+        )
 
         # Calculate the Typical Price.
         self._frame['typical_price'] = (self._frame['high'] + self._frame['low'] + self._frame['close']) / 3
@@ -846,12 +1173,13 @@ class Indicators():
             >>> indicator_client.standard_deviation(period=9)
         """
 
-        locals_data = locals()
-        del locals_data['self']
-
-        self._current_indicators[column_name] = {}
-        self._current_indicators[column_name]['args'] = locals_data
-        self._current_indicators[column_name]['func'] = self.standard_deviation
+        self._current_indicators[column_name] = IndicatorSpec(
+            func=self.standard_deviation,
+            args={
+                'period': period,
+                'column_name': column_name
+            }
+        )
 
         # Calculate the Standard Deviation.
         self._frame[column_name] = self._frame['close'].transform(
@@ -885,12 +1213,13 @@ class Indicators():
             >>> indicator_client.chaikin_oscillator(period=9)
         """
 
-        locals_data = locals()
-        del locals_data['self']
-
-        self._current_indicators[column_name] = {}
-        self._current_indicators[column_name]['args'] = locals_data
-        self._current_indicators[column_name]['func'] = self.chaikin_oscillator
+        self._current_indicators[column_name] = IndicatorSpec(
+            func=self.chaikin_oscillator,
+            args={
+                'period': period,
+                'column_name': column_name
+            }
+        )
 
         # Calculate the Money Flow Multiplier.
         money_flow_multiplier_top = 2 * (self._frame['close'] - self._frame['high'] - self._frame['low'])
@@ -946,12 +1275,20 @@ class Indicators():
             >>> indicator_client.mass_index(period=9)
         """
 
-        locals_data = locals()
-        del locals_data['self']
-
-        self._current_indicators[column_name] = {}
-        self._current_indicators[column_name]['args'] = locals_data
-        self._current_indicators[column_name]['func'] = self.kst_oscillator
+        self._current_indicators[column_name] = IndicatorSpec(
+            func=self.kst_oscillator,
+            args={
+                'r1': r1,
+                'r2': r2,
+                'r3': r3,
+                'r4': r4,
+                'n1': n1,
+                'n2': n2,
+                'n3': n3,
+                'n4': n4,
+                'column_name': column_name
+            }
+        )
 
         # Calculate the ROC 1.
         self._frame['roc_1'] = self._frame['close'].diff(r1 - 1)  / self._frame['close'].shift(r1 - 1)
@@ -1000,24 +1337,160 @@ class Indicators():
 
         return self._frame
 
+    def lr_proj(self, period: int, column: str = 'close', column_name: str = 'lr_proj') -> pd.DataFrame:
+        """Calculates the Linear Regression Projection.
+
+        Overview:
+        ----
+        Fits a least-squares line over the last `period` bars for each symbol
+        and projects it to the current bar. This is sometimes referred to as
+        the Time Series Forecast or the Linear Regression Indicator.
+
+        Arguments:
+        ----
+        period {int} -- The number of periods to use when calculating 
+            the regression.
+
+        column {str} -- The column to regress. A `float32` column is read without
+            a copy, anything else is read as `float64`. (default: {'close'})
+
+        Returns:
+        ----
+        {pd.DataFrame} -- A Pandas data frame with the Linear Regression Projection included.
+
+        Usage:
+        ----
+            >>> historical_prices_df = trading_robot.grab_historical_prices(
+                start=start_date,
+                end=end_date,
+                bar_size=1,
+                bar_type='minute'
+            )
+            >>> price_data_frame = pd.DataFrame(data=historical_prices)
+            >>> indicator_client = Indicators(price_data_frame=price_data_frame)
+            >>> indicator_client.lr_proj(period=14)
+        """
+
+        self._current_indicators[column_name] = IndicatorSpec(
+            func=self.lr_proj,
+            args={
+                'period': period,
+                'column': column,
+                'column_name': column_name
+            }
+        )
+
+        # Calculate the Linear Regression Projection.
+        self._frame[column_name] = self._lr_proj_columns(column=column, periods=[period])[:, 0]
+
+        return self._frame
+
+    def _lr_proj_columns(self, column: str, periods: List[int]) -> np.ndarray:
+        """Calculates the Linear Regression Projection for several window sizes at once.
+
+        Arguments:
+        ----
+        column {str} -- The column to regress.
+
+        periods {List[int]} -- The number of periods to use for each projection.
+
+        Returns:
+        ----
+        {np.ndarray} -- A `(T, K)` matrix with one column per period, in the same
+            row order as the frame.
+        """
+
+        values = _column_values(column=self._frame[column])
+        periods = np.asarray(periods, dtype=np.int64)
+
+        # Put each symbol's rows next to each other, unless they already are.
+        order = None
+
+        if self.is_multi_index:
+
+            codes = self._frame.index.codes[0]
+
+            if np.any(codes[1:] < codes[:-1]):
+                order = np.argsort(codes, kind='stable')
+                codes = codes[order]
+
+            starts = np.flatnonzero(np.diff(codes)) + 1
+            starts = np.concatenate(([0], starts, [len(codes)])).astype(np.int64)
+
+        else:
+            starts = np.array([0, len(values)], dtype=np.int64)
+
+        grouped = values if order is None else values[order]
+        results = np.empty((len(values), len(periods)))
+
+        if _NUMBA_AVAILABLE:
+
+            # Run every symbol on its own core.
+            _lr_proj_grouped(grouped, starts, periods, results)
+
+        elif _CYTHON_AVAILABLE:
+
+            for start, end in zip(starts[:-1], starts[1:]):
+                lr_proj_c(grouped[start:end], periods, results[start:end])
+
+        else:
+
+            # Lay the symbols out side by side, one column per symbol, aligned by bar number.
+            lengths = np.diff(starts)
+            symbol = np.repeat(np.arange(len(lengths)), lengths)
+            position = np.arange(len(values)) - np.repeat(starts[:-1], lengths)
+
+            wide = np.zeros((lengths.max(initial=0), len(lengths)))
+            wide[position, symbol] = grouped
+
+            for k, period in enumerate(periods):
+                results[:, k] = _lr_proj_wide(wide, period)[position, symbol]
+
+        if order is None:
+            return results
+
+        # Put the rows back in the frame's order.
+        projections = np.empty_like(results)
+        projections[order] = results
+
+        return projections
+
     def refresh(self):
         """Updates the Indicator columns after adding the new rows."""
 
         # First update the groups since, we have new rows.
         self._price_groups = self._stock_frame.symbol_groups
 
+        # Projections on the same column are calculated together, so the column is only read once.
+        projections = {}
+
         # Grab all the details of the indicators so far.
         for indicator in self._current_indicators:
             
+            # Grab the arguments.
+            indicator_argument = self._current_indicators[indicator].args
+
             # Grab the function.
-            indicator_argument = self._current_indicators[indicator]['args']
+            indicator_function = self._current_indicators[indicator].func
 
-            # Grab the arguments.
-            indicator_function = self._current_indicators[indicator]['func']
+            if indicator_function == self.lr_proj:
+                projections.setdefault(indicator_argument['column'], []).append(indicator_argument)
+                continue
 
             # Update the function.
             indicator_function(**indicator_argument)
 
+        for column, arguments in projections.items():
+
+            results = self._lr_proj_columns(
+                column=column,
+                periods=[argument['period'] for argument in arguments]
+            )
+
+            # Assign in place, so the StockFrame keeps sharing the frame and the columns keep their order.
+            for k, argument in enumerate(arguments):
+                self._frame[argument['column_name']] = results[:, k]
+
     def check_signals(self) -> Union[pd.DataFrame, None]:
         """Checks to see if any signals have been generated.
 
@@ -1030,7 +1503,8 @@ class Indicators():
         signals_df = self._stock_frame._check_signals(
             indicators=self._indicator_signals,
             indciators_comp_key=self._indicators_comp_key,
-            indicators_key=self._indicators_key
+            indicators_key=self._indicators_key,
+            signal_rows=self._sig_rows
         )
 
         return signals_df
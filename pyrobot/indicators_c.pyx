@@ -0,0 +1,121 @@
+# cython: language_level=3
+"""Cython version of the linear regression kernel in `pyrobot.indicators`.
+
+Used when Numba isn't installed. `pip install` builds it on its own, since
+Cython is listed in `pyproject.toml`. With `--no-build-isolation` Cython has to
+be installed first, and without it, or without a C compiler, the pure NumPy
+version is used instead.
+"""
+
+cimport cython
+
+from cython cimport floating
+from libc.math cimport NAN
+from libc.math cimport isnan
+
+# How often the running sums are recomputed from the window itself, see `pyrobot.indicators`.
+cdef long long RESYNC_STEPS = 1024
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cpdef void lr_proj_c(const floating[::1] y, const long long[::1] periods, double[:, ::1] out):
+    """Calculates rolling linear regression projections in a single pass.
+
+    Arguments:
+    ----
+    y {np.ndarray} -- The `float32` or `float64` values to regress, normally the
+        closing prices of one symbol. The sums are always kept in `float64`.
+
+    periods {np.ndarray} -- The `int64` sizes of the regression windows.
+
+    out {np.ndarray} -- A C-contiguous `(T, K)` matrix the projections are
+        written to, the first `n - 1` values of each column are `NaN`. So is
+        every window holding a missing value.
+
+    The running sums are recomputed from the window every 1024 steps, at most
+    once every `n` steps, so rounding errors don't build up over long series.
+    """
+
+    cdef Py_ssize_t size = y.shape[0]
+    cdef Py_ssize_t count = periods.shape[0]
+    cdef Py_ssize_t t, k, j
+    cdef long long n
+    cdef double value, leaving, window_value, sum_x, sum_xx, slope, intercept
+    cdef bint value_missing
+    cdef double[::1] sum_y = cython.view.array(shape=(max(count, 1),), itemsize=sizeof(double), format='d')
+    cdef double[::1] sum_xy = cython.view.array(shape=(max(count, 1),), itemsize=sizeof(double), format='d')
+    cdef long long[::1] missing = cython.view.array(shape=(max(count, 1),), itemsize=sizeof(long long), format='q')
+    cdef long long[::1] resynced = cython.view.array(shape=(max(count, 1),), itemsize=sizeof(long long), format='q')
+
+    for k in range(count):
+        sum_y[k] = 0.0
+        sum_xy[k] = 0.0
+        missing[k] = 0
+        resynced[k] = 0
+
+    for t in range(size):
+
+        # Start over from the window ending at the previous value, before the rounding errors build up.
+        if t > 0 and t % RESYNC_STEPS == 0:
+
+            for k in range(count):
+
+                n = periods[k]
+                if n < 2 or t < n or t - resynced[k] < n:
+                    continue
+
+                resynced[k] = t
+                sum_y[k] = 0.0
+                sum_xy[k] = 0.0
+
+                for j in range(n):
+                    window_value = y[t - n + j]
+                    if not isnan(window_value):
+                        sum_y[k] += window_value
+                        sum_xy[k] += j * window_value
+
+        # Missing values are added to the sums as `0` and counted.
+        value = y[t]
+        value_missing = isnan(value)
+        if value_missing:
+            value = 0.0
+
+        for k in range(count):
+
+            n = periods[k]
+
+            if n < 2:
+                out[t, k] = NAN
+                continue
+
+            # Slide the window, every value shifts one step to the left.
+            if t >= n:
+
+                leaving = y[t - n]
+                if isnan(leaving):
+                    leaving = 0.0
+                    missing[k] -= 1
+
+                sum_xy[k] += (n - 1) * value - (sum_y[k] - leaving)
+                sum_y[k] += value - leaving
+
+            else:
+                sum_xy[k] += t * value
+                sum_y[k] += value
+
+            if value_missing:
+                missing[k] += 1
+
+            if t < n - 1 or missing[k] > 0:
+                out[t, k] = NAN
+                continue
+
+            # These only depend on the window size.
+            sum_x = n * (n - 1) / 2.0
+            sum_xx = (n - 1) * n * (2 * n - 1) / 6.0
+
+            slope = (n * sum_xy[k] - sum_x * sum_y[k]) / (n * sum_xx - sum_x * sum_x)
+            intercept = (sum_y[k] - slope * sum_x) / n
+            out[t, k] = intercept + slope * (n - 1)
@@ -0,0 +1,15 @@
+try:
+    from numba import njit
+    from numba import prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Leaves the function as plain Python when Numba isn't installed."""
+
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        return lambda func: func
@@ -1,3 +1,5 @@
+import operator
+import numpy as np
 import pandas as pd
 
 from typing import List
@@ -8,6 +10,166 @@ from pandas.core.groupby import DataFrameGroupBy
 from pandas.core.window import RollingGroupby
 from pandas.core.window import Window
 
+from pyrobot.jit import NUMBA_AVAILABLE
+from pyrobot.jit import njit
+
+# The operators that signals can be evaluated with as arrays, anything else is called directly.
+_OP_TO_CODE = {
+    operator.gt: 0,
+    operator.ge: 1,
+    operator.lt: 2,
+    operator.le: 3,
+    operator.eq: 4
+}
+
+
+# One row per indicator signal, the operators are stored as `_OP_TO_CODE` codes.
+_SIGNAL_DTYPE = np.dtype([
+    ('buy', 'f8'),
+    ('sell', 'f8'),
+    ('buy_max', 'f8'),
+    ('sell_max', 'f8'),
+    ('buy_op', 'i1'),
+    ('sell_op', 'i1'),
+    ('buy_op_max', 'i1'),
+    ('sell_op_max', 'i1')
+])
+
+# The threshold, operator code and operator key used for each condition in a signal row.
+_SIGNAL_CONDITIONS = {
+    'buys': [('buy', 'buy_op', 'buy_operator'), ('buy_max', 'buy_op_max', 'buy_operator_max')],
+    'sells': [('sell', 'sell_op', 'sell_operator'), ('sell_max', 'sell_op_max', 'sell_operator_max')]
+}
+
+
+def _signal_row(signal: dict) -> tuple:
+    """Converts an indicator signal into a `_SIGNAL_DTYPE` row.
+
+    Arguments:
+    ----
+    signal {dict} -- The signal, as stored by `Indicators.set_indicator_signal`.
+
+    Returns:
+    ----
+    {tuple} -- The row values. Operators without a code are stored as `-1`. A max
+        threshold without an operator is compared with `<=`, and when both are
+        missing the max condition never blocks a signal.
+    """
+
+    def max_condition(threshold: float, condition) -> tuple:
+
+        if threshold is None and condition is None:
+            return np.inf, _OP_TO_CODE[operator.le]
+
+        if condition is None:
+            return threshold, _OP_TO_CODE[operator.le]
+
+        return threshold, _OP_TO_CODE.get(condition, -1)
+
+    buy_max, buy_op_max = max_condition(signal.get('buy_max'), signal.get('buy_operator_max'))
+    sell_max, sell_op_max = max_condition(signal.get('sell_max'), signal.get('sell_operator_max'))
+
+    return (
+        signal['buy'],
+        signal['sell'],
+        buy_max,
+        sell_max,
+        _OP_TO_CODE.get(signal['buy_operator'], -1),
+        _OP_TO_CODE.get(signal['sell_operator'], -1),
+        buy_op_max,
+        sell_op_max
+    )
+
+
+@njit(cache=True)
+def _cmp(a: float, b: float, code: int) -> bool:
+    """Compares two values using an operator code, see `_OP_TO_CODE`.
+
+    Arguments:
+    ----
+    a {float} -- The left hand side, normally the indicator value.
+
+    b {float} -- The right hand side, normally the threshold.
+
+    code {int} -- The operator code.
+
+    Returns:
+    ----
+    {bool} -- The result of the comparison, `False` for unknown codes.
+    """
+
+    if code == 0:
+        return a > b
+    elif code == 1:
+        return a >= b
+    elif code == 2:
+        return a < b
+    elif code == 3:
+        return a <= b
+    elif code == 4:
+        return a == b
+
+    return False
+
+
+@njit(cache=True)
+def _compare_jit(values: np.ndarray, thresholds: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    """Compares each indicator column to its threshold using its operator code.
+
+    Arguments:
+    ----
+    values {np.ndarray} -- A `(S, K)` matrix with the indicator values, one column per indicator.
+
+    thresholds {np.ndarray} -- The `K` thresholds to compare against.
+
+    codes {np.ndarray} -- The `K` operator codes, see `_OP_TO_CODE`.
+
+    Returns:
+    ----
+    {np.ndarray} -- A `(S, K)` boolean matrix, `True` where the condition is met.
+    """
+
+    result = np.zeros(values.shape, dtype=np.bool_)
+
+    for i in range(values.shape[0]):
+        for k in range(values.shape[1]):
+            result[i, k] = _cmp(values[i, k], thresholds[k], codes[k])
+
+    return result
+
+
+def _compare_select(values: np.ndarray, thresholds: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    """The NumPy version of `_compare_jit`, used when Numba isn't installed.
+
+    Arguments:
+    ----
+    values {np.ndarray} -- A `(S, K)` matrix with the indicator values, one column per indicator.
+
+    thresholds {np.ndarray} -- The `K` thresholds to compare against.
+
+    codes {np.ndarray} -- The `K` operator codes, see `_OP_TO_CODE`.
+
+    Returns:
+    ----
+    {np.ndarray} -- A `(S, K)` boolean matrix, `True` where the condition is met.
+    """
+
+    return np.select(
+        [codes == 0, codes == 1, codes == 2, codes == 3, codes == 4],
+        [
+            values > thresholds,
+            values >= thresholds,
+            values < thresholds,
+            values <= thresholds,
+            values == thresholds
+        ],
+        default=False
+    )
+
+
+# Without Numba, a Python loop per element would be slower than building every comparison.
+_compare = _compare_jit if NUMBA_AVAILABLE else _compare_select
+
 
 class StockFrame():
 
@@ -221,7 +383,8 @@ class StockFrame():
                     self._frame.columns)
             ))
 
-    def _check_signals(self, indicators: dict, indciators_comp_key: List[str], indicators_key: List[str]) -> Union[pd.DataFrame, None]:
+    def _check_signals(self, indicators: dict, indciators_comp_key: List[str], indicators_key: List[str],
+                       signal_rows: Dict[str, np.ndarray] = None) -> Union[pd.DataFrame, None]:
         """Returns the last row of the StockFrame if conditions are met.
 
         Overview:
@@ -232,7 +395,9 @@ class StockFrame():
         compare the indicator column values with the conditions specified
         by the user.
 
-        If the conditions are met the row will be returned back to the user.
+        If the conditions are met the row will be returned back to the user. When
+        more than one indicator is compared to a numerical value, only the last one
+        in `indicators_key` decides the signal, the others are not evaluated.
 
         Arguments:
         ----
@@ -245,6 +410,10 @@ class StockFrame():
         indicators_key List[str] -- A list of the indicators where we are comparing
             one indicator to a numerical value.
 
+        signal_rows {Dict[str, np.ndarray]} -- The `_SIGNAL_DTYPE` row of each indicator in
+            `indicators_key`. Only the row of the last indicator is read, and it's built
+            from `indicators` if it isn't there. (defaults to None).
+
         Returns:
         ----
         {Union[pd.DataFrame, None]} -- If signals are generated then, a pandas.DataFrame object
@@ -258,32 +427,40 @@ class StockFrame():
         conditions = {}
 
         # Check to see if all the columns exist.
-        if self.do_indicator_exist(column_names=indicators_key):
+        if indicators_key and self.do_indicator_exist(column_names=indicators_key):
 
-            for indicator in indicators_key:
+            # The last indicator decides the signal, as each one overwrites the one before it.
+            indicator = indicators_key[-1]
 
-                column = last_rows[indicator]
+            # Build the thresholds and the operators if they weren't passed through.
+            if signal_rows is not None and indicator in signal_rows:
+                signal_row = signal_rows[indicator]
+            else:
+                signal_row = np.array([_signal_row(indicators[indicator])], dtype=_SIGNAL_DTYPE)
 
-                # Grab the Buy & Sell Condition.
-                buy_condition_target = indicators[indicator]['buy']
-                sell_condition_target = indicators[indicator]['sell']
+            # Grab the values of every symbol.
+            values = last_rows[[indicator]].to_numpy(dtype=np.float64)
 
-                buy_condition_operator = indicators[indicator]['buy_operator']
-                sell_condition_operator = indicators[indicator]['sell_operator']
+            for side, side_conditions in _SIGNAL_CONDITIONS.items():
 
-                condition_1: pd.Series = buy_condition_operator(
-                    column, buy_condition_target
-                )
-                condition_2: pd.Series = sell_condition_operator(
-                    column, sell_condition_target
-                )
+                met = np.ones(values.shape, dtype=bool)
 
-                condition_1 = condition_1.where(lambda x: x == True).dropna()
-                condition_2 = condition_2.where(lambda x: x == True).dropna()
+                for threshold_field, code_field, operator_key in side_conditions:
+
+                    # Evaluate every symbol at once.
+                    thresholds = signal_row[threshold_field]
+                    codes = signal_row[code_field]
+                    condition = _compare(values, thresholds, codes)
+
+                    # Operators we don't have a code for are called directly.
+                    if codes[0] < 0:
+                        condition[:, 0] = indicators[indicator][operator_key](values[:, 0], thresholds[0])
+
+                    met &= condition
+
+                # Keep the rows where every condition is met.
+                conditions[side] = pd.Series(True, index=last_rows.index[met[:, 0]])
 
-                conditions['buys'] = condition_1
-                conditions['sells'] = condition_2
-        
         # Store the indicators in a list.
         check_indicators = []
         
@@ -1,6 +1,22 @@
 from setuptools import setup
+from setuptools import Extension
 from setuptools import find_namespace_packages
 
+# Build the Cython version of the indicator kernels. Cython is a build requirement in
+# `pyproject.toml`, this only matters for builds run with `--no-build-isolation`.
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        Extension(
+            name='pyrobot.indicators_c',
+            sources=['pyrobot/indicators_c.pyx'],
+            # Without a compiler the package still installs and uses the NumPy version.
+            optional=True
+        )
+    )
+except ImportError:
+    ext_modules = []
+
 # load the README file.
 with open(file="README.md", mode="r") as fh:
     long_description = fh.read()
@@ -29,6 +45,10 @@ setup(
         'numpy==1.19.0'
     ],
 
+    extras_require={
+        'numba': ['numba>=0.50.0']
+    },
+
     keywords='finance, td ameritrade, api, trading robot',
 
     packages=find_namespace_packages(
@@ -38,6 +58,8 @@ setup(
 
     include_package_data=True,
 
+    ext_modules=ext_modules,
+
     python_requires='>=3.8',
 
     classifiers=[
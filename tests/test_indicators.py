@@ -5,16 +5,22 @@ it will test different properties and methods of the object.
 """
 import unittest
 import operator
+import pyrobot.indicators
+import numpy as np
 import pandas as pd
 
 from unittest import TestCase
+from unittest import mock
 from datetime import datetime
 from datetime import timedelta
+from typing import Callable
 from configparser import ConfigParser
 
 from pyrobot.robot import PyRobot
 from pyrobot.indicators import Indicators
 from pyrobot.stock_frame import StockFrame
+from pyrobot.stock_frame import _compare_jit
+from pyrobot.stock_frame import _compare_select
 
 
 class PyRobotIndicatorTest(TestCase):
@@ -122,6 +128,18 @@ class PyRobotIndicatorTest(TestCase):
         # And that it's not empty.
         self.assertFalse(self.stock_frame.frame['ema'].empty)
 
+    def test_lr_proj(self):
+        """Test adding the Linear Regression Projection."""
+        
+        # Create the Linear Regression Projection indicator.
+        self.indicator_client.lr_proj(period=14)
+
+        # Check if we have the column.
+        self.assertIn('lr_proj', self.stock_frame.frame.columns)
+
+        # And that it's not empty.
+        self.assertFalse(self.stock_frame.frame['lr_proj'].empty)
+
     def test_indicator_exist(self):
         """Test checkinf if an indicator column exist."""
         
@@ -187,5 +205,343 @@ class PyRobotIndicatorTest(TestCase):
         self.indicator_client = None
 
 
+class PyRobotIndicatorCalculationTest(TestCase):
+
+    """Will test the indicator calculations on made up prices, so it doesn't need the API."""
+
+    def setUp(self) -> None:
+        """Set up a StockFrame with two symbols of different lengths, with the rows interleaved."""
+
+        random_state = np.random.RandomState(seed=7)
+
+        lengths = {'MSFT': 120, 'AAPL': 90}
+        prices = {
+            symbol: 150 + np.cumsum(random_state.normal(size=length))
+            for symbol, length in lengths.items()
+        }
+
+        data = []
+        for bar in range(max(lengths.values())):
+            for symbol, closes in prices.items():
+                if bar < len(closes):
+                    data.append({
+                        'symbol': symbol,
+                        'datetime': 1586390400000 + 60000 * bar,
+                        'open': closes[bar],
+                        'close': closes[bar],
+                        'high': closes[bar] + 0.5,
+                        'low': closes[bar] - 0.5,
+                        'volume': 1000
+                    })
+
+        self.prices = prices
+        self.stock_frame = StockFrame(data=data)
+        self.indicator_client = Indicators(price_data_frame=self.stock_frame)
+
+        # Add two indicators to build signals on.
+        self.indicator_client.sma(period=5)
+        self.indicator_client.lr_proj(period=5)
+
+    def reference_lr_proj(self, period: int) -> pd.Series:
+        """Calculates the Linear Regression Projection with `np.polyfit`, one window at a time."""
+
+        x = np.arange(period)
+        projections = []
+
+        for _, closes in self.stock_frame.frame['close'].groupby(level=0):
+
+            values = np.full(len(closes), np.nan)
+
+            for t in range(period - 1, len(closes)):
+                window = closes.to_numpy(dtype=np.float64)[t - period + 1:t + 1]
+                if not np.isnan(window).any():
+                    values[t] = np.polyval(np.polyfit(x, window, 1), period - 1)
+
+            projections.append(pd.Series(values, index=closes.index))
+
+        return pd.concat(projections).reindex(self.stock_frame.frame.index)
+
+    def assert_lr_proj(self) -> None:
+        """Calculates the `lr_proj` and `lr_proj_12` columns and compares them to `np.polyfit`."""
+
+        self.indicator_client.lr_proj(period=5)
+        self.indicator_client.lr_proj(period=12, column_name='lr_proj_12')
+
+        frame = self.stock_frame.frame
+
+        np.testing.assert_allclose(frame['lr_proj'], self.reference_lr_proj(period=5), rtol=1e-9)
+        np.testing.assert_allclose(frame['lr_proj_12'], self.reference_lr_proj(period=12), rtol=1e-9)
+
+    def test_lr_proj_values(self):
+        """Test the Linear Regression Projection on unsorted symbols of different lengths."""
+
+        self.assertTrue(np.any(np.diff(self.stock_frame.frame.index.codes[0]) < 0))
+        self.assert_lr_proj()
+
+    def test_lr_proj_values_numpy(self):
+        """Test the NumPy version of the Linear Regression Projection."""
+
+        with mock.patch.object(pyrobot.indicators, '_NUMBA_AVAILABLE', False), \
+                mock.patch.object(pyrobot.indicators, '_CYTHON_AVAILABLE', False):
+            self.assert_lr_proj()
+
+    @unittest.skipUnless(pyrobot.indicators._CYTHON_AVAILABLE, 'The Cython extension isn\'t built.')
+    def test_lr_proj_values_cython(self):
+        """Test the Cython version of the Linear Regression Projection."""
+
+        with mock.patch.object(pyrobot.indicators, '_NUMBA_AVAILABLE', False):
+            self.assert_lr_proj()
+
+    def test_lr_proj_float32_column(self):
+        """Test that a `float32` column is read without a copy and still summed in `float64`."""
+
+        self.stock_frame.frame['close'] = self.stock_frame.frame['close'].astype(np.float32)
+        closes = self.stock_frame.frame['close']
+
+        values = pyrobot.indicators._column_values(column=closes)
+
+        self.assertEqual(values.dtype, np.float32)
+        self.assertTrue(np.shares_memory(values, closes.to_numpy()))
+
+        self.assert_lr_proj()
+
+    def test_lr_proj_missing_values(self):
+        """Test that only the windows holding a missing value are `NaN`, with every version."""
+
+        self.stock_frame.frame.loc[('MSFT', 1586390400000 + 60000 * 30), 'close'] = np.nan
+        self.stock_frame.frame.loc[('AAPL', 1586390400000 + 60000 * 60), 'close'] = np.nan
+
+        self.assert_lr_proj()
+
+        with mock.patch.object(pyrobot.indicators, '_NUMBA_AVAILABLE', False), \
+                mock.patch.object(pyrobot.indicators, '_CYTHON_AVAILABLE', False):
+            self.assert_lr_proj()
+
+        if pyrobot.indicators._CYTHON_AVAILABLE:
+            with mock.patch.object(pyrobot.indicators, '_NUMBA_AVAILABLE', False):
+                self.assert_lr_proj()
+
+    def assert_long_lr_proj(self, kernel: Callable) -> None:
+        """Runs an online kernel on a long series and compares it to `_lr_proj_wide`."""
+
+        random_state = np.random.RandomState(seed=7)
+
+        # A high price with small moves, so any rounding error the sums build up shows.
+        closes = 6e5 + np.cumsum(random_state.normal(scale=50.0, size=200000))
+        closes[[1000, 150000]] = np.nan
+
+        periods = np.array([5, 64], dtype=np.int64)
+        projections = np.empty((len(closes), len(periods)))
+
+        kernel(closes, periods, projections)
+
+        for k, period in enumerate(periods):
+            expected = pyrobot.indicators._lr_proj_wide(closes[:, None], period)[:, 0]
+            np.testing.assert_allclose(projections[:, k], expected, rtol=1e-10)
+
+    @unittest.skipUnless(pyrobot.indicators._NUMBA_AVAILABLE, 'Numba isn\'t installed.')
+    def test_lr_proj_long_series(self):
+        """Test that the Numba version stays accurate over a long series."""
+
+        self.assert_long_lr_proj(kernel=pyrobot.indicators._lr_proj_online)
+
+    @unittest.skipUnless(pyrobot.indicators._CYTHON_AVAILABLE, 'The Cython extension isn\'t built.')
+    def test_lr_proj_long_series_cython(self):
+        """Test that the Cython version stays accurate over a long series."""
+
+        self.assert_long_lr_proj(kernel=pyrobot.indicators.lr_proj_c)
+
+    def test_refresh_lr_proj(self):
+        """Test that refreshing recalculates every projection and keeps the column order."""
+
+        self.indicator_client.lr_proj(period=12, column_name='lr_proj_12')
+
+        frame = self.stock_frame.frame
+        columns = frame.columns.to_list()
+
+        frame['lr_proj'] = 0.0
+        frame['lr_proj_12'] = 0.0
+
+        self.indicator_client.refresh()
+
+        # The StockFrame and the Indicators have to keep sharing the same frame.
+        self.assertIs(self.stock_frame.frame, self.indicator_client.price_data_frame)
+        self.assertListEqual(self.stock_frame.frame.columns.to_list(), columns)
+
+        np.testing.assert_allclose(frame['lr_proj'], self.reference_lr_proj(period=5), rtol=1e-9)
+        np.testing.assert_allclose(frame['lr_proj_12'], self.reference_lr_proj(period=12), rtol=1e-9)
+
+    def test_compare_versions(self):
+        """Test that both versions of the signal comparison agree, for every operator code."""
+
+        random_state = np.random.RandomState(seed=7)
+
+        values = random_state.randint(-2, 3, size=(50, 6)).astype(np.float64)
+        thresholds = np.zeros(6)
+        codes = np.array([0, 1, 2, 3, 4, -1], dtype=np.int8)
+
+        expected = np.column_stack([
+            values[:, 0] > 0,
+            values[:, 1] >= 0,
+            values[:, 2] < 0,
+            values[:, 3] <= 0,
+            values[:, 4] == 0,
+            np.zeros(50, dtype=bool)
+        ])
+
+        np.testing.assert_array_equal(_compare_jit(values, thresholds, codes), expected)
+        np.testing.assert_array_equal(_compare_select(values, thresholds, codes), expected)
+
+    def test_last_indicator_signal_decides(self):
+        """Test that the last indicator compared to a value decides the signal."""
+
+        # Every `sma` is above 0, but no `lr_proj` is below it.
+        self.indicator_client.set_indicator_signal(
+            indicator='sma',
+            buy=0.0,
+            sell=0.0,
+            condition_buy=operator.gt,
+            condition_sell=operator.gt
+        )
+        self.indicator_client.set_indicator_signal(
+            indicator='lr_proj',
+            buy=0.0,
+            sell=0.0,
+            condition_buy=operator.lt,
+            condition_sell=operator.lt
+        )
+
+        signals = self.indicator_client.check_signals()
+
+        self.assertTrue(signals['buys'].empty)
+        self.assertTrue(signals['sells'].empty)
+
+    def test_last_indicator_signal_decides_reversed(self):
+        """Test that the last indicator decides the signal, with the indicators swapped."""
+
+        self.indicator_client.set_indicator_signal(
+            indicator='lr_proj',
+            buy=0.0,
+            sell=0.0,
+            condition_buy=operator.lt,
+            condition_sell=operator.lt
+        )
+        self.indicator_client.set_indicator_signal(
+            indicator='sma',
+            buy=0.0,
+            sell=0.0,
+            condition_buy=operator.gt,
+            condition_sell=operator.gt
+        )
+
+        signals = self.indicator_client.check_signals()
+
+        self.assertCountEqual(signals['buys'].index.get_level_values(0), ['MSFT', 'AAPL'])
+        self.assertCountEqual(signals['sells'].index.get_level_values(0), ['MSFT', 'AAPL'])
+
+    def test_last_indicator_signal_decides_after_update(self):
+        """Test that updating an earlier indicator's signal doesn't make it decide the signal."""
+
+        self.indicator_client.set_indicator_signal(
+            indicator='sma',
+            buy=0.0,
+            sell=0.0,
+            condition_buy=operator.gt,
+            condition_sell=operator.gt
+        )
+        self.indicator_client.set_indicator_signal(
+            indicator='lr_proj',
+            buy=0.0,
+            sell=0.0,
+            condition_buy=operator.lt,
+            condition_sell=operator.lt
+        )
+        self.indicator_client.set_indicator_signal(
+            indicator='sma',
+            buy=1.0,
+            sell=1.0,
+            condition_buy=operator.gt,
+            condition_sell=operator.gt
+        )
+
+        signals = self.indicator_client.check_signals()
+
+        self.assertTrue(signals['buys'].empty)
+        self.assertTrue(signals['sells'].empty)
+
+    def test_max_threshold_blocks_signal(self):
+        """Test that a symbol above the `buy_max` threshold doesn't generate a buy signal."""
+
+        last_values = self.stock_frame.frame['lr_proj'].groupby(level=0).last()
+
+        self.indicator_client.set_indicator_signal(
+            indicator='lr_proj',
+            buy=0.0,
+            sell=0.0,
+            condition_buy=operator.gt,
+            condition_sell=operator.lt,
+            buy_max=last_values.mean(),
+            condition_buy_max=operator.lt
+        )
+
+        signals = self.indicator_client.check_signals()
+
+        self.assertListEqual(signals['buys'].index.get_level_values(0).to_list(), [last_values.idxmin()])
+        self.assertTrue(signals['sells'].empty)
+
+    def test_max_threshold_without_operator(self):
+        """Test that a `buy_max` threshold without an operator blocks the values above it."""
+
+        last_values = self.stock_frame.frame['lr_proj'].groupby(level=0).last()
+
+        self.indicator_client.set_indicator_signal(
+            indicator='lr_proj',
+            buy=0.0,
+            sell=0.0,
+            condition_buy=operator.gt,
+            condition_sell=operator.lt,
+            buy_max=last_values.mean()
+        )
+
+        signals = self.indicator_client.check_signals()
+
+        self.assertListEqual(signals['buys'].index.get_level_values(0).to_list(), [last_values.idxmin()])
+
+    def test_max_operator_without_threshold(self):
+        """Test that a max operator without a max threshold is rejected."""
+
+        with self.assertRaises(ValueError):
+            self.indicator_client.set_indicator_signal(
+                indicator='lr_proj',
+                buy=0.0,
+                sell=0.0,
+                condition_buy=operator.gt,
+                condition_sell=operator.lt,
+                condition_buy_max=operator.gt
+            )
+
+    def test_custom_operator_signal(self):
+        """Test that an operator outside the `operator` module is called directly."""
+
+        self.indicator_client.set_indicator_signal(
+            indicator='lr_proj',
+            buy=0.0,
+            sell=0.0,
+            condition_buy=lambda value, threshold: value > threshold,
+            condition_sell=lambda value, threshold: value < threshold
+        )
+
+        signals = self.indicator_client.check_signals()
+
+        self.assertCountEqual(signals['buys'].index.get_level_values(0), ['MSFT', 'AAPL'])
+        self.assertTrue(signals['sells'].empty)
+
+    def tearDown(self) -> None:
+        """Teardown the Indicator object."""
+
+        self.stock_frame = None
+        self.indicator_client = None
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file